@@ -3,14 +3,20 @@ Application layer - Contains use cases and DTOs. This layer orchestrates the bus
 defines the input/output contracts for the API.
 """
 
-from api.application.dtos import PredictionInput, PredictionOutput
+from api.application.dtos import (
+  BatchPredictionError, BatchPredictionInput, BatchPredictionOutput, PredictionInput,
+  PredictionOutput)
 from api.application.protocols import ModelRepositoryProtocol
-from api.application.use_cases import PredictRevenueUseCase
+from api.application.use_cases import PredictRevenueBatchUseCase, PredictRevenueUseCase
 
 
 __all__ = [
+  'BatchPredictionError',
+  'BatchPredictionInput',
+  'BatchPredictionOutput',
   'ModelRepositoryProtocol',
   'PredictionInput',
   'PredictionOutput',
+  'PredictRevenueBatchUseCase',
   'PredictRevenueUseCase'
 ]
@@ -47,3 +47,51 @@ class PredictionOutput(BaseModel):
 
   model_info: str = Field(
     default='Polynomial Regression (degree=2)', description='Model used for prediction')
+
+
+class BatchPredictionInput(BaseModel):
+  """
+  Input data for predicting revenue for several sellers in one request.
+
+  Attributes:
+    items: Input features for each prediction.
+  """
+  items: list[PredictionInput] = Field(
+    ..., min_length=1, max_length=1000, description='Inputs to predict, up to 1000 per request')
+
+
+class BatchPredictionError(BaseModel):
+  """
+  Error for a single item of a batch prediction.
+
+  Attributes:
+    index: Position of the failing item in the input items.
+    detail: Why no prediction was returned for the item.
+  """
+  index: int = Field(..., description='Position of the item in the input items', examples=[1])
+
+  detail: str = Field(
+    ..., description='Why the item has no prediction',
+    examples=['Predicted revenue cannot be negative'])
+
+
+class BatchPredictionOutput(BaseModel):
+  """
+  Output data from batch revenue prediction. Items whose prediction violates the domain rules have
+  no prediction and are reported in errors instead, so the rest of the batch is still returned.
+
+  Attributes:
+    predictions: Predicted revenues in BRL, in the same order as the input items (None for items
+      that failed).
+    errors: Errors for the items without a prediction.
+    model_info: Information about the model used.
+  """
+  predictions: list[float | None] = Field(
+    ..., description='Predicted revenues in BRL (R$), in input order; null for failed items',
+    examples=[[5644.24, None]])
+
+  errors: list[BatchPredictionError] = Field(
+    default_factory=list, description='Errors for the items without a prediction')
+
+  model_info: str = Field(
+    default='Polynomial Regression (degree=2)', description='Model used for prediction')
@@ -25,4 +25,16 @@ class ModelRepositoryProtocol(Protocol):
     Returns:
       Predicted revenue in BRL.
     """
+    pass
+
+  def predict_batch(self, inputs: list[tuple[int, int, int]]) -> list[float]:
+    """
+    Make revenue predictions for several inputs at once.
+
+    Args:
+      inputs: (experience_months, number_of_sales, seasonal_factor) triples.
+
+    Returns:
+      Predicted revenues in BRL, in the same order as the inputs.
+    """
     pass
\ No newline at end of file
@@ -3,7 +3,9 @@ Use cases for the sales prediction API. Use cases contain the application busine
 orchestrate the interaction between domain entities and infrastructure.
 """
 
-from api.application.dtos import PredictionInput, PredictionOutput
+from api.application.dtos import (
+  BatchPredictionError, BatchPredictionInput, BatchPredictionOutput, PredictionInput,
+  PredictionOutput)
 from api.application.protocols import ModelRepositoryProtocol
 from api.domain.sales_prediction import SalesPrediction
 
@@ -11,7 +13,8 @@ from api.domain.sales_prediction import SalesPrediction
 class PredictRevenueUseCase:
   """
   Use case for predicting sales revenue. This use case orchestrates the prediction flow: Receives
-  validated input; Uses the ML model to predict revenue; Returns the prediction as a domain entity.
+  validated input; Uses the ML model to predict revenue; Checks the prediction against the domain
+  rules; Returns the prediction as an output DTO.
 
   Attributes:
     model_repository: Repository for accessing the ML model.
@@ -34,6 +37,9 @@ class PredictRevenueUseCase:
 
     Returns:
       PredictionOutput with the predicted revenue.
+
+    Raises:
+      ValueError: If the prediction violates the domain rules.
     """
     # Get prediction from model repository
     predicted_revenue = self.model_repository.predict(
@@ -41,16 +47,66 @@ class PredictRevenueUseCase:
       number_of_sales=input_data.number_of_sales,
       seasonal_factor=input_data.seasonal_factor)
 
-    # Create domain entity (validates business rules)
-    prediction = SalesPrediction(
+    # Validate business rules (the inputs were already checked by PredictionInput, so only the
+    # prediction itself needs checking)
+    SalesPrediction.validate_predicted_revenue(predicted_revenue)
+
+    # Return DTO for API response (validated construction runs in pydantic-core and is cheaper
+    # than the pure-Python model_construct for a model this small)
+    return PredictionOutput(
+      predicted_revenue=predicted_revenue,
       experience_months=input_data.experience_months,
       number_of_sales=input_data.number_of_sales,
-      seasonal_factor=input_data.seasonal_factor,
-      predicted_revenue=predicted_revenue)
+      seasonal_factor=input_data.seasonal_factor)
 
-    # Return DTO for API response
-    return PredictionOutput(
-      predicted_revenue=prediction.predicted_revenue,
-      experience_months=prediction.experience_months,
-      number_of_sales=prediction.number_of_sales,
-      seasonal_factor=prediction.seasonal_factor)
\ No newline at end of file
+
+class PredictRevenueBatchUseCase:
+  """
+  Use case for predicting sales revenue for several sellers at once. All inputs are scored with a
+  single call to the model repository, so per-request costs are shared across the whole batch.
+
+  Attributes:
+    model_repository: Repository for accessing the ML model.
+  """
+  def __init__(self, model_repository: ModelRepositoryProtocol) -> None:
+    """
+    Initialize the use case with dependencies.
+
+    Args:
+      model_repository: Repository for model access.
+    """
+    self.model_repository = model_repository
+
+  def execute(self, input_data: BatchPredictionInput) -> BatchPredictionOutput:
+    """
+    Execute the batch revenue prediction.
+
+    Args:
+      input_data: Validated batch input data from the API.
+
+    Returns:
+      BatchPredictionOutput with one predicted revenue per input item, and an error (with the
+      item's index) for each prediction that violates the domain rules.
+    """
+    inputs = [
+      (item.experience_months, item.number_of_sales, item.seasonal_factor)
+      for item in input_data.items]
+
+    # Get all predictions from model repository in one call
+    predicted_revenues = self.model_repository.predict_batch(inputs)
+
+    # Validate business rules item by item, so one invalid prediction doesn't fail the whole batch
+    predictions: list[float | None] = []
+    errors: list[BatchPredictionError] = []
+    for index, predicted_revenue in enumerate(predicted_revenues):
+      try:
+        SalesPrediction.validate_predicted_revenue(predicted_revenue)
+      except ValueError as e:
+        predictions.append(None)
+        errors.append(BatchPredictionError(index=index, detail=str(e)))
+      else:
+        predictions.append(predicted_revenue)
+
+    # Return DTO for API response (the predictions are trusted floats, so validating the list
+    # item by item is skipped)
+    return BatchPredictionOutput.model_construct(predictions=predictions, errors=errors)
@@ -39,5 +39,19 @@ class SalesPrediction:
     if not 1 <= self.seasonal_factor <= 10:
       raise ValueError('Seasonal factor must be between 1 and 10')
 
-    if self.predicted_revenue < 0:
+    self.validate_predicted_revenue(self.predicted_revenue)
+
+  @staticmethod
+  def validate_predicted_revenue(predicted_revenue: float) -> None:
+    """
+    Validate a predicted revenue value. Exposed separately so callers holding already-validated
+    inputs can enforce this rule without building the entity.
+
+    Args:
+      predicted_revenue: Predicted revenue in BRL.
+
+    Raises:
+      ValueError: If the predicted revenue is negative.
+    """
+    if predicted_revenue < 0:
       raise ValueError('Predicted revenue cannot be negative')
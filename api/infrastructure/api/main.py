@@ -3,10 +3,39 @@ FastAPI application factory and configuration. This module creates and configure
 application.
 """
 
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from api.application.use_cases import PredictRevenueBatchUseCase, PredictRevenueUseCase
 from api.infrastructure.api.routes import router
+from api.infrastructure.ml.model_repository import ModelRepository
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+  """
+  Load and warm up the model once at startup and share it across requests. The repository and use
+  cases are kept on the application state, so handlers read them directly instead of resolving
+  dependencies on every request.
+
+  Args:
+    app: The FastAPI application being started.
+  """
+  model_repository = ModelRepository()
+
+  # Run throwaway predictions so lazy numpy/BLAS initialisation happens before the first request
+  model_repository.predict(0, 0, 1)
+  model_repository.predict_batch([(0, 0, 1)])
+
+  app.state.model_repository = model_repository
+  app.state.use_case = PredictRevenueUseCase(model_repository)
+  app.state.batch_use_case = PredictRevenueBatchUseCase(model_repository)
+  yield
 
 
 def create_app() -> FastAPI:
@@ -25,12 +54,16 @@ def create_app() -> FastAPI:
     version='1.0.0',
     docs_url='/docs',
     redoc_url='/redoc',
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
   )
 
-  # Configure CORS
-  app.add_middleware(
-    CORSMiddleware, allow_origins=['*'],
-    allow_credentials=True, allow_methods=['*'], allow_headers=['*'])
+  # Configure CORS only when browsers call the API directly (ENABLE_CORS=true), since the middleware
+  # adds work to every request and the Streamlit frontend calls the API server-side
+  if os.getenv('ENABLE_CORS', 'false').lower() == 'true':
+    app.add_middleware(
+      CORSMiddleware, allow_origins=['*'],
+      allow_credentials=True, allow_methods=['GET', 'POST'], allow_headers=['Content-Type'])
 
   # Include routers
   app.include_router(router)
@@ -39,9 +72,10 @@ def create_app() -> FastAPI:
   @app.get(
     '/health',
     tags=['health'],
+    response_model=None,
     summary='Health check',
     description='Check if the API is running.')
-  def health_check() -> dict:
+  async def health_check() -> dict:
     """
     Health check endpoint.
 
@@ -59,7 +93,32 @@ app = create_app()
 
 def start() -> None:
   """
-  Start the API server. This function is used by the poetry script command.
+  Start the API server for production. This function is used by the poetry script command. Runs one
+  worker per CPU available to the process (or WEB_CONCURRENCY workers) without auto-reload or
+  per-request access logging. The event loop and HTTP parser are picked automatically, which
+  selects uvloop and httptools wherever they are installed (uvicorn[standard] doesn't install uvloop
+  on Windows).
+  """
+  import uvicorn
+
+  # Respect CPU affinity limits (e.g. taskset or container cpusets) where the platform exposes them
+  if hasattr(os, 'sched_getaffinity'):
+    cpu_count = len(os.sched_getaffinity(0))
+  else:
+    cpu_count = os.cpu_count() or 1
+
+  uvicorn.run(
+    'api.infrastructure.api.main:app', host='0.0.0.0', port=8000,
+    loop='auto', http='auto',
+    workers=int(os.getenv('WEB_CONCURRENCY') or cpu_count),
+    reload=False, access_log=False)
+
+
+def dev() -> None:
+  """
+  Start the API server for development, with a single worker that reloads on code changes.
   """
   import uvicorn
-  uvicorn.run('api.infrastructure.api.main:app', host='0.0.0.0', port=8000, reload=True)
+  uvicorn.run(
+    'api.infrastructure.api.main:app', host='0.0.0.0', port=8000,
+    loop='auto', http='auto', workers=1, reload=True)
@@ -2,8 +2,16 @@
 ML infrastructure - Model loading and prediction.
 """
 
-from api.infrastructure.ml.model_repository import ModelRepository
-from api.infrastructure.ml.protocols import RegressorModelProtocol
+import os
+
+# Predictions run on tiny matrices, where multi-threaded BLAS only adds thread start-up and
+# contention with the other API workers. Pin the math libraries to one thread before numpy is
+# imported (explicit environment settings still take precedence).
+for _variable in ('OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS', 'OMP_NUM_THREADS'):
+  os.environ.setdefault(_variable, '1')
+
+from api.infrastructure.ml.model_repository import ModelRepository  # noqa: E402
+from api.infrastructure.ml.protocols import RegressorModelProtocol  # noqa: E402
 
 
 __all__ = ['ModelRepository', 'RegressorModelProtocol']
@@ -3,12 +3,17 @@ Model repository implementation. This module implements the ModelRepositoryProto
 loading the trained ML model and making predictions.
 """
 
+import math
+import threading
+from functools import lru_cache
 from pathlib import Path
+from typing import cast
 
+import numpy as np
 import pandas as pd
 from sklearn.preprocessing import PolynomialFeatures
 
-from core.persistence import ModelLoader
+from core.persistence import ModelLoader, get_default_loader
 from api.infrastructure.ml.protocols import RegressorModelProtocol
 
 
@@ -22,31 +27,165 @@ class ModelRepository:
     transformer: Fitted polynomial transformer.
     model: Trained prediction model.
     metadata: Model metadata.
+    powers: Exponents of each transformed feature, or None if the transformer doesn't expose them.
+    coefficients: Closed-form polynomial coefficients, or None if the model can't be reduced.
   """
   FEATURE_NAMES = ['years_of_experience', 'number_of_sales', 'seasonal_factor']
+  PREDICTION_CACHE_SIZE = 65536
+
+  # Exponents of (experience, sales, seasonal) for each term of a degree-2 polynomial, in the order
+  # the closed-form coefficients are stored
+  POLYNOMIAL_TERMS = (
+    (0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1), (2, 0, 0),
+    (1, 1, 0), (1, 0, 1), (0, 2, 0), (0, 1, 1), (0, 0, 2))
+
+  # Inputs used to check the closed-form polynomial against the sklearn pipeline
+  VERIFICATION_INPUTS = ((0, 0, 1), (36, 50, 7), (600, 1000, 10))
 
   def __init__(self, models_dir: Path | str | None = None) -> None:
     """
     Initialize the repository and load the model.
 
     Args:
-      models_dir: Path to the models directory.
+      models_dir: Path to the models directory. Uses the shared default loader if None.
     """
-    self.model_loader = ModelLoader(models_dir)
+    self.model_loader = ModelLoader(models_dir) if models_dir else get_default_loader()
     self.transformer: PolynomialFeatures | None = None
     self.model: RegressorModelProtocol | None = None
     self.metadata: dict | None = None
+    self.powers: np.ndarray | None = None
+    self.coefficients: tuple[float, ...] | None = None
+
+    # Reusable input row for the sklearn pipeline, guarded since handlers may run on several threads
+    self._input_buffer = np.empty((1, len(self.FEATURE_NAMES)), dtype=np.float64)
+    self._input_lock = threading.Lock()
+
     self._load_model()
 
+    # The model is deterministic and its inputs are small bounded integers, so repeated feature
+    # triples are served from a bounded LRU cache instead of running the pipeline again
+    self._cached_predict = lru_cache(maxsize=self.PREDICTION_CACHE_SIZE)(self._predict)
+
   def _load_model(self) -> None:
     """
     Load all model artifacts from disk.
     """
     self.transformer, self.model, self.metadata = self.model_loader.load_all()
+    self.powers = self._load_powers()
+    self.coefficients = self._compile_coefficients()
+
+  def _load_powers(self) -> np.ndarray | None:
+    """
+    Extract the monomial exponents from the polynomial transformer. Each output feature is the
+    product of the inputs raised to one row of this matrix, which is all the transformer computes.
+    The exponent columns follow the order the transformer was fitted with, so they are only used if
+    that order is FEATURE_NAMES (the sklearn path enforces it by checking the DataFrame's columns).
+
+    Returns:
+      Integer matrix with shape (n_output_features, n_features), or None if the transformer is not
+      a polynomial expansion of FEATURE_NAMES in that order.
+    """
+    powers = getattr(self.transformer, 'powers_', None)
+    if powers is None or np.ndim(powers) != 2 or np.shape(powers)[1] != len(self.FEATURE_NAMES):
+      return None
+
+    feature_names = getattr(self.transformer, 'feature_names_in_', self.FEATURE_NAMES)
+    if list(feature_names) != self.FEATURE_NAMES:
+      return None
+
+    return np.asarray(powers, dtype=np.int8)
+
+  def _compile_coefficients(self) -> tuple[float, ...] | None:
+    """
+    Fold the polynomial transformer and the linear model into the ten coefficients of a closed-form
+    degree-2 polynomial, so predictions become a handful of scalar multiply-adds instead of a
+    sklearn transform + predict. Coefficients are kept as double-precision Python floats.
+
+    Returns:
+      Coefficients ordered as POLYNOMIAL_TERMS, or None if the artifacts can't be reduced to a
+      degree-2 polynomial (in which case the sklearn pipeline is used).
+    """
+    powers = self.powers
+
+    # Prefer the flat weights exported alongside the model; the verification below still guards
+    # against a flat file that is out of date with the pickled model
+    raw_coef: np.ndarray | None
+    raw_intercept: float | np.ndarray | None
+    try:
+      raw_coef, raw_intercept = self.model_loader.load_flat_model()
+    except FileNotFoundError:
+      raw_coef = getattr(self.model, 'coef_', None)
+      raw_intercept = getattr(self.model, 'intercept_', None)
+    if powers is None or raw_coef is None or raw_intercept is None:
+      return None
+
+    coef = np.ravel(raw_coef)
+    intercept = np.ravel(raw_intercept)
+    if len(coef) != len(powers) or len(intercept) != 1:
+      return None
+
+    terms = dict.fromkeys(self.POLYNOMIAL_TERMS, 0.0)
+    terms[(0, 0, 0)] = float(intercept[0])
+    for exponents, value in zip(powers.tolist(), coef.tolist()):
+      term = tuple(exponents)
+      if term not in terms:
+        return None
+
+      terms[term] += value
+
+    coefficients = tuple(terms.values())
+
+    # Only trust the closed form if it reproduces the pipeline (e.g. the model is really linear)
+    for inputs in self.VERIFICATION_INPUTS:
+      actual = self._evaluate(coefficients, *inputs)
+      expected = self._predict_pipeline(*inputs)
+      if not math.isclose(actual, expected, rel_tol=1e-9, abs_tol=1e-6):
+        return None
+
+    return coefficients
+
+  @staticmethod
+  def _evaluate(
+    coefficients: tuple[float, ...],
+    experience_months: int,
+    number_of_sales: int,
+    seasonal_factor: int) -> float:
+    """
+    Evaluate the closed-form degree-2 polynomial. Terms are grouped by their first variable
+    (Horner-style), which needs 9 multiplications instead of 15.
+
+    Args:
+      coefficients: Coefficients ordered as POLYNOMIAL_TERMS.
+      experience_months: Seller's experience in months.
+      number_of_sales: Number of sales made.
+      seasonal_factor: Seasonal factor (1-10).
+
+    Returns:
+      Predicted revenue in BRL.
+    """
+    c0, c1, c2, c3, c4, c5, c6, c7, c8, c9 = coefficients
+    e, s, f = experience_months, number_of_sales, seasonal_factor
+
+    return float(
+      c0 + e * (c1 + c4 * e + c5 * s + c6 * f) + s * (c2 + c7 * s + c8 * f) + f * (c3 + c9 * f))
 
   def predict(self, experience_months: int, number_of_sales: int, seasonal_factor: int) -> float:
     """
-    Make a revenue prediction.
+    Make a revenue prediction, reusing cached results for previously seen inputs.
+
+    Args:
+      experience_months: Seller's experience in months.
+      number_of_sales: Number of sales made.
+      seasonal_factor: Seasonal factor (1-10).
+
+    Returns:
+      Predicted revenue in BRL.
+    """
+    return self._cached_predict(experience_months, number_of_sales, seasonal_factor)
+
+  def _predict(self, experience_months: int, number_of_sales: int, seasonal_factor: int) -> float:
+    """
+    Predict a single input, using the closed-form polynomial when available.
 
     Args:
       experience_months: Seller's experience in months.
@@ -56,18 +195,80 @@ class ModelRepository:
     Returns:
       Predicted revenue in BRL.
     """
-    # Prepare input array
-    input_df = pd.DataFrame(
-      [[experience_months, number_of_sales, seasonal_factor]], columns=self.FEATURE_NAMES)
+    if self.coefficients is None:
+      return self._predict_pipeline(experience_months, number_of_sales, seasonal_factor)
+
+    return self._evaluate(self.coefficients, experience_months, number_of_sales, seasonal_factor)
+
+  def _predict_pipeline(
+    self, experience_months: int, number_of_sales: int, seasonal_factor: int) -> float:
+    """
+    Run the sklearn transformer and model for a single input.
+
+    Args:
+      experience_months: Seller's experience in months.
+      number_of_sales: Number of sales made.
+      seasonal_factor: Seasonal factor (1-10).
 
-    # Transform features
-    input_transformed = self.transformer.transform(input_df)
+    Returns:
+      Predicted revenue in BRL.
+    """
+    with self._input_lock:
+      # Fill the preallocated input row and transform it
+      self._input_buffer[0] = (experience_months, number_of_sales, seasonal_factor)
+      input_transformed = self._transform(self._input_buffer)
 
     # Make prediction
     prediction = self.model.predict(input_transformed)[0]
 
     return float(prediction)
 
+  def _transform(self, X: np.ndarray) -> np.ndarray:
+    """
+    Expand raw features into the model's polynomial features. With the transformer's exponents
+    available this is a single broadcast power-and-product, skipping sklearn's input validation and
+    the DataFrame it needs to check feature names; otherwise the transformer itself is used.
+
+    Args:
+      X: Raw features with shape (n_samples, n_features), ordered as FEATURE_NAMES.
+
+    Returns:
+      Transformed features with shape (n_samples, n_output_features).
+    """
+    if self.powers is not None:
+      return cast(np.ndarray, np.prod(X[:, None, :] ** self.powers, axis=-1))
+
+    # The transformer was fitted with feature names, so it expects a DataFrame
+    input_df = pd.DataFrame(X, columns=self.FEATURE_NAMES, copy=False)
+
+    return cast(np.ndarray, self.transformer.transform(input_df))
+
+  def predict_batch(self, inputs: list[tuple[int, int, int]]) -> list[float]:
+    """
+    Make revenue predictions for many inputs at once. All rows are scored with a single vectorized
+    evaluation, so the per-call numpy/sklearn overhead is paid once for the whole batch.
+
+    Args:
+      inputs: (experience_months, number_of_sales, seasonal_factor) triples.
+
+    Returns:
+      Predicted revenues in BRL, in the same order as the inputs.
+    """
+    if not inputs:
+      return []
+
+    X = np.asarray(inputs, dtype=np.float64).reshape(-1, len(self.FEATURE_NAMES))
+
+    if self.coefficients is None:
+      return cast(list[float], self.model.predict(self._transform(X)).tolist())
+
+    # Build the (n_samples, 10) monomial matrix ordered as POLYNOMIAL_TERMS and apply all
+    # coefficients with one matrix-vector product
+    e, s, f = X.T
+    terms = np.column_stack((np.ones_like(e), e, s, f, e * e, e * s, e * f, s * s, s * f, f * f))
+
+    return cast(list[float], (terms @ np.asarray(self.coefficients)).tolist())
+
   def get_model_info(self) -> dict:
     """
     Get information about the loaded model.
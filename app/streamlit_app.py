@@ -7,8 +7,8 @@ revenue predictions using the trained ML model.
 
 import os
 
+import httpx
 import streamlit as st
-import requests
 
 # Use environment variable for API URL, fallback to localhost for development
 API_URL = os.getenv('API_URL', 'http://localhost:8000')
@@ -17,6 +17,19 @@ API_URL = os.getenv('API_URL', 'http://localhost:8000')
 if API_URL and not API_URL.startswith('http'):
   API_URL = f'https://{API_URL}'
 
+
+@st.cache_resource
+def get_client() -> httpx.Client:
+  """
+  Create the HTTP client for the API. It is cached across reruns, so the keep-alive connection is
+  reused instead of opening a new one on every interaction.
+
+  Returns:
+    HTTP client bound to the API base URL.
+  """
+  return httpx.Client(base_url=API_URL, timeout=10.0)
+
+
 st.set_page_config(
   page_title='Sales Revenue Prediction', page_icon='📈',
   layout='centered', initial_sidebar_state='collapsed')
@@ -114,14 +127,14 @@ with st.sidebar:
   st.header('ℹ️ Model Information')
   
   try:
-    response = requests.get(f'{API_URL}/api/v1/model/info', timeout=5)
+    response = get_client().get('/api/v1/model/info', timeout=5.0)
     if response.status_code == 200:
       model_info = response.json()
       st.success('Model loaded successfully!')
       st.json(model_info)
     else:
       st.error('Failed to load model info')
-  except requests.exceptions.ConnectionError:
+  except (httpx.ConnectError, httpx.ConnectTimeout):
     st.warning('API not available. Make sure the API is running.')
   except Exception as e:
     st.error(f'Error: {str(e)}')
@@ -180,7 +193,7 @@ if st.button('🔮 Predict Revenue', use_container_width=True):
         'seasonal_factor': seasonal_factor,
       }
 
-      response = requests.post(f'{API_URL}/api/v1/predict', json=payload, timeout=10)
+      response = get_client().post('/api/v1/predict', json=payload)
 
       if response.status_code == 200:
         result = response.json()
@@ -211,7 +224,7 @@ if st.button('🔮 Predict Revenue', use_container_width=True):
       else:
         st.error(f'Prediction failed: {response.text}')
 
-    except requests.exceptions.ConnectionError:
+    except (httpx.ConnectError, httpx.ConnectTimeout):
       st.error(
         '❌ Could not connect to the API. Make sure the API is running with `poetry run poe api`')
     except Exception as e:
@@ -4,8 +4,8 @@ preprocessing, persistence, and evaluation that can be used by notebooks, API, a
 """
 
 from core.evaluation import ModelEvaluator
-from core.persistence import ModelLoader
+from core.persistence import ModelLoader, get_default_loader
 from core.preprocessing import DataPreprocessor
 
 
-__all__ = ['DataPreprocessor', 'ModelLoader', 'ModelEvaluator']
+__all__ = ['DataPreprocessor', 'ModelLoader', 'ModelEvaluator', 'get_default_loader']
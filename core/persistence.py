@@ -3,13 +3,41 @@ Model persistence utilities for sales prediction. This module handles: Saving tr
 transformers to disk; Loading models and transformers from disk; Managing model metadata.
 """
 
+import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import joblib
+import numpy as np
 from sklearn.preprocessing import PolynomialFeatures
 
 
+@lru_cache(maxsize=1)
+def _resolve_models_dir() -> Path:
+  """
+  Find the saved_models directory. Searches in common locations relative to the current working
+  directory and the module location. The result is cached, so the search runs once per process.
+
+  Returns:
+    Path to the saved_models directory.
+  """
+  # Possible locations to search
+  possible_paths = [
+    Path('saved_models'),  # Current working directory
+    Path('/app/saved_models'),  # Docker container
+    Path(__file__).parent.parent / 'saved_models',  # Relative to this file
+  ]
+
+  for path in possible_paths:
+    if path.exists():
+      return path
+
+  # If not found, default to current directory (for saving new models)
+  return Path('saved_models')
+
+
 class ModelLoader:
   """
   Handles loading and saving of trained models and transformers. This class provides a centralized
@@ -18,6 +46,9 @@ class ModelLoader:
   Attributes:
     models_dir: Path to the directory containing saved models.
   """
+  ARTIFACT_SUFFIXES = ('.joblib', '.json', '.npy')
+  PREFETCH_CHUNK_SIZE = 1024 * 1024
+
   def __init__(self, models_dir: str | Path | None = None) -> None:
     """
     Initialize the model loader.
@@ -28,36 +59,35 @@ class ModelLoader:
     if models_dir:
       self.models_dir = Path(models_dir)
     else:
-      self.models_dir = self._find_models_dir()
+      self.models_dir = _resolve_models_dir()
 
-  def _find_models_dir(self) -> Path:
-    """
-    Find the saved_models directory. Searches in common locations relative to the current working
-    directory and the module location.
-
-    Returns:
-      Path to the saved_models directory.
+    # Loaded artifacts keyed by filename, so each file is deserialized at most once per loader
+    self._cache: dict[str, Any] = {}
 
-    Raises:
-      FileNotFoundError: If saved_models directory cannot be found.
+  def prefetch(self) -> None:
     """
-    # Possible locations to search
-    possible_paths = [
-      Path('saved_models'),  # Current working directory
-      Path('/app/saved_models'),  # Docker container
-      Path(__file__).parent.parent / 'saved_models',  # Relative to this file
-    ]
+    Pull the saved artifacts into the OS page cache ahead of loading them, so neither unpickling nor
+    the first reads of memory-mapped arrays wait on the disk. Uses posix_fadvise where available,
+    and otherwise reads each file through once.
+    """
+    if not self.models_dir.is_dir():
+      return
 
-    for path in possible_paths:
-      if path.exists():
-        return path
+    for filepath in self.models_dir.iterdir():
+      if filepath.suffix not in self.ARTIFACT_SUFFIXES or not filepath.is_file():
+        continue
 
-    # If not found, default to current directory (for saving new models)
-    return Path('saved_models')
+      with filepath.open('rb') as file:
+        if hasattr(os, 'posix_fadvise'):
+          os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        else:
+          while file.read(self.PREFETCH_CHUNK_SIZE):
+            pass
 
   def save_model(self, model: Any, filename: str) -> Path:
     """
-    Save a model to disk.
+    Save a model to disk, uncompressed and with pickle protocol 5. The file is written next to its
+    destination and then renamed over it, so readers never see a partially written model.
 
     Args:
       model: The model object to save.
@@ -72,13 +102,22 @@ class ModelLoader:
       filename = f'{filename}.joblib'
 
     filepath = self.models_dir / filename
-    joblib.dump(model, filepath)
+    temp_filepath = filepath.with_suffix('.joblib.tmp')
+    try:
+      joblib.dump(model, temp_filepath, compress=0, protocol=5)
+      temp_filepath.replace(filepath)
+    finally:
+      # Only left over if writing failed, since a successful rename moves it away
+      temp_filepath.unlink(missing_ok=True)
+    self._cache.pop(filename, None)
 
     return filepath
 
   def load_model(self, filename: str) -> Any:
     """
-    Load a model from disk.
+    Load a model from disk. NumPy arrays inside the artifact are memory-mapped read-only, so worker
+    processes loading the same file share its pages through the OS page cache. Loaded artifacts are
+    cached, so later calls for the same file return the same object without touching the disk.
 
     Args:
       filename: Name of the file to load.
@@ -92,12 +131,19 @@ class ModelLoader:
     if not filename.endswith('.joblib'):
       filename = f'{filename}.joblib'
 
+    if filename in self._cache:
+      return self._cache[filename]
+
     filepath = self.models_dir / filename
 
-    if not filepath.exists():
-      raise FileNotFoundError(f'Model not found: {filepath}')
+    try:
+      model = joblib.load(filepath, mmap_mode='r')
+    except FileNotFoundError as error:
+      raise FileNotFoundError(f'Model not found: {filepath}') from error
 
-    return joblib.load(filepath)
+    self._cache[filename] = model
+
+    return model
 
   def load_transformer(self) -> PolynomialFeatures:
     """
@@ -117,14 +163,111 @@ class ModelLoader:
     """
     return self.load_model('revenue_model')
 
+  def save_metadata(self, metadata: dict) -> Path:
+    """
+    Save model metadata as JSON. Metadata is a plain dictionary, so JSON keeps it human-readable
+    and avoids unpickling when it is loaded back. Like save_model, the file is written next to its
+    destination and then renamed over it.
+
+    Args:
+      metadata: Dictionary containing model metadata.
+
+    Returns:
+      Path to the saved file.
+    """
+    self.models_dir.mkdir(exist_ok=True)
+
+    filepath = self.models_dir / 'model_metadata.json'
+    temp_filepath = filepath.with_suffix('.json.tmp')
+    try:
+      with temp_filepath.open('w', encoding='utf-8') as file:
+        json.dump(metadata, file, indent=2)
+      temp_filepath.replace(filepath)
+    finally:
+      temp_filepath.unlink(missing_ok=True)
+    self._cache.pop(filepath.name, None)
+
+    return filepath
+
   def load_metadata(self) -> dict:
     """
-    Load model metadata.
+    Load model metadata. Reads model_metadata.json, falling back to the legacy joblib file for
+    model directories saved before metadata was stored as JSON.
 
     Returns:
       Dictionary containing model metadata.
+
+    Raises:
+      FileNotFoundError: If neither metadata file exists.
     """
-    return self.load_model('model_metadata')
+    filepath = self.models_dir / 'model_metadata.json'
+
+    if filepath.name in self._cache:
+      return cast(dict, self._cache[filepath.name])
+
+    metadata: dict
+    try:
+      with filepath.open(encoding='utf-8') as file:
+        metadata = json.load(file)
+    except FileNotFoundError:
+      return cast(dict, self.load_model('model_metadata'))
+
+    self._cache[filepath.name] = metadata
+
+    return metadata
+
+  def save_flat_model(self, coef: np.ndarray, intercept: float | np.ndarray) -> Path:
+    """
+    Save the weights of a linear model as a flat float64 vector (intercept followed by the
+    coefficients), which can be loaded without unpickling any sklearn object. Weights are always
+    stored as float64. Like save_model, the file is written next to its destination and then
+    renamed over it.
+
+    Args:
+      coef: Model coefficients, one per transformed feature.
+      intercept: Model intercept.
+
+    Returns:
+      Path to the saved file.
+    """
+    self.models_dir.mkdir(exist_ok=True)
+
+    filepath = self.models_dir / 'revenue_model_flat.npy'
+    temp_filepath = filepath.with_suffix('.npy.tmp')
+    try:
+      with temp_filepath.open('wb') as file:
+        np.save(file, np.concatenate((np.ravel(intercept), np.ravel(coef))).astype(np.float64))
+      temp_filepath.replace(filepath)
+    finally:
+      temp_filepath.unlink(missing_ok=True)
+    self._cache.pop(filepath.name, None)
+
+    return filepath
+
+  def load_flat_model(self) -> tuple[np.ndarray, float]:
+    """
+    Load the flat linear model weights.
+
+    Returns:
+      Tuple of (coefficients, intercept).
+
+    Raises:
+      FileNotFoundError: If the flat model file doesn't exist.
+    """
+    filepath = self.models_dir / 'revenue_model_flat.npy'
+
+    if filepath.name in self._cache:
+      return cast(tuple[np.ndarray, float], self._cache[filepath.name])
+
+    try:
+      values = np.load(filepath)
+    except FileNotFoundError as error:
+      raise FileNotFoundError(f'Model not found: {filepath}') from error
+
+    flat_model = (values[1:], float(values[0]))
+    self._cache[filepath.name] = flat_model
+
+    return flat_model
 
   def load_all(self) -> tuple[PolynomialFeatures, Any, dict]:
     """
@@ -134,3 +277,18 @@ class ModelLoader:
       Tuple of (transformer, model, metadata).
     """
     return (self.load_transformer(), self.load_predictor(), self.load_metadata())
+
+
+@lru_cache(maxsize=1)
+def get_default_loader() -> ModelLoader:
+  """
+  Get the process-wide loader for the default models directory. The model artifacts are prefetched
+  and loaded eagerly here, so every later load through this loader is a cache lookup.
+
+  Returns:
+    Shared ModelLoader instance with its artifacts already loaded.
+  """
+  loader = ModelLoader()
+  loader.prefetch()
+  loader.load_all()
+  return loader
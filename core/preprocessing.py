@@ -16,10 +16,10 @@ class DataPreprocessor:
   Attributes:
     degree: Polynomial degree for feature transformation.
     transformer: Fitted PolynomialFeatures instance.
-    feature_names: List of original feature names. 
+    feature_names: Tuple of original feature names.
   """
 
-  EXPECTED_FEATURES = ['years_of_experience', 'number_of_sales', 'seasonal_factor']
+  EXPECTED_FEATURES = ('years_of_experience', 'number_of_sales', 'seasonal_factor')
 
   def __init__(self, degree: int = 2) -> None:
     """
@@ -30,11 +30,13 @@ class DataPreprocessor:
     """
     self.degree = degree
     self.transformer: PolynomialFeatures | None = None
-    self.feature_names = self.EXPECTED_FEATURES.copy()
+    self.feature_names = self.EXPECTED_FEATURES
+    self._feature_names_out: list[str] | None = None
 
   def fit(self, X: pd.DataFrame | np.ndarray) -> 'DataPreprocessor':
     """
-    Fit the polynomial transformer on training data.
+    Fit the polynomial transformer on training data. The transformed feature names are computed
+    once here, since they cannot change until the next fit.
 
     Args:
       X: Training features with shape (n_samples, n_features).
@@ -42,13 +44,17 @@ class DataPreprocessor:
     Returns:
       Fitted DataPreprocessor instance.
     """
+    self._feature_names_out = None
     self.transformer = PolynomialFeatures(degree=self.degree, include_bias=False)
     self.transformer.fit(X)
+    self._feature_names_out = self.transformer.get_feature_names_out().tolist()
     return self
 
   def transform(self, X: pd.DataFrame | np.ndarray) -> np.ndarray:
     """
-    Transform features using the fitted polynomial transformer.
+    Transform features using the fitted polynomial transformer. NumPy input is converted to
+    column-major float64, the layout PolynomialFeatures computes its products on, so sklearn does
+    not make its own copy. DataFrames are passed through unchanged to keep their feature names.
 
     Args:
       X: Features to transform with shape (n_samples, n_features).
@@ -62,6 +68,9 @@ class DataPreprocessor:
     if self.transformer is None:
       raise ValueError('Transformer not fitted. Call fit() first.')
 
+    if isinstance(X, np.ndarray):
+      X = np.asfortranarray(X, dtype=np.float64)
+
     return self.transformer.transform(X)
 
   def fit_transform(self, X: pd.DataFrame | np.ndarray) -> np.ndarray:
@@ -86,30 +95,99 @@ class DataPreprocessor:
     Raises:
       ValueError: If transformer has not been fitted.
     """
-    if self.transformer is None:
+    if self._feature_names_out is None:
       raise ValueError('Transformer not fitted. Call fit() first.')
 
-    return self.transformer.get_feature_names_out().tolist()
+    return self._feature_names_out.copy()
 
-  def validate_input(self, data: dict) -> np.ndarray:
+  def validate_input(self, data: dict | list[dict]) -> np.ndarray:
     """
-    Validate and convert input dictionary to numpy array.
+    Validate and convert input data to numpy array. A list of dictionaries is converted in a single
+    pass, so a whole batch can be transformed with one call.
 
     Args:
-      data: Dictionary with feature names as keys.
+      data: Dictionary with feature names as keys, or a list of such dictionaries.
 
     Returns:
-      Numpy array with shape (1, n_features).
+      Column-major float64 numpy array with shape (1, n_features) for a dictionary, or
+      (n_samples, n_features) for a list.
     
     Raises:
       ValueError: If required features are missing.
     """
-    missing = set(self.EXPECTED_FEATURES) - set(data.keys())
+    if isinstance(data, list):
+      return self._validate_batch(data)
+
+    missing = [feature for feature in self.EXPECTED_FEATURES if feature not in data]
     if missing:
-      raise ValueError(f'Missing required features: {missing}')
+      raise ValueError(f'Missing required features: {set(missing)}')
 
     return np.array([[
       data['years_of_experience'],
       data['number_of_sales'],
       data['seasonal_factor']
-    ]])
+    ]], dtype=np.float64, order='F')
+
+  def _validate_batch(self, data: list[dict]) -> np.ndarray:
+    """
+    Convert a list of input dictionaries to a column-major numpy array.
+
+    Args:
+      data: List of dictionaries with feature names as keys.
+
+    Returns:
+      Column-major float64 numpy array with shape (n_samples, n_features).
+
+    Raises:
+      ValueError: If required features are missing from any row.
+    """
+    n_features = len(self.EXPECTED_FEATURES)
+
+    try:
+      # Filled feature by feature, so the transposed view below is already column-major
+      values = np.fromiter(
+        (row[feature] for feature in self.EXPECTED_FEATURES for row in data),
+        dtype=np.float64, count=len(data) * n_features)
+    except KeyError:
+      for row in data:
+        missing = [feature for feature in self.EXPECTED_FEATURES if feature not in row]
+        if missing:
+          raise ValueError(f'Missing required features: {set(missing)}') from None
+      raise
+
+    return values.reshape(n_features, len(data)).T
+
+  def validate_and_transform(self, data: dict) -> np.ndarray:
+    """
+    Validate an input dictionary and transform it in a single step. For the default schema (a
+    degree-2 transformer fitted on the expected features) the polynomial terms are computed
+    directly, in the same column order as PolynomialFeatures, without going through sklearn's input
+    validation. Any other configuration falls back to validate_input followed by transform.
+
+    Args:
+      data: Dictionary with feature names as keys.
+
+    Returns:
+      Transformed features with shape (1, n_transformed_features).
+
+    Raises:
+      ValueError: If required features are missing, or if the fallback path is taken and the
+        transformer has not been fitted.
+    """
+    is_default_schema = (
+      self.degree == 2
+      and tuple(self.feature_names) == self.EXPECTED_FEATURES
+      and self.transformer is not None
+      and self.transformer.n_features_in_ == len(self.EXPECTED_FEATURES))
+    if not is_default_schema:
+      return self.transform(self.validate_input(data))
+
+    missing = [feature for feature in self.EXPECTED_FEATURES if feature not in data]
+    if missing:
+      raise ValueError(f'Missing required features: {set(missing)}')
+
+    e = float(data['years_of_experience'])
+    s = float(data['number_of_sales'])
+    f = float(data['seasonal_factor'])
+
+    return np.array([[e, s, f, e * e, e * s, e * f, s * s, s * f, f * f]])
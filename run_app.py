@@ -2,15 +2,16 @@
 Entry point for running the Streamlit app.
 """
 
-import subprocess
+import os
 import sys
 
 
 def main() -> None:
   """
-  Run the Streamlit application.
+  Run the Streamlit application. The current process is replaced by Streamlit instead of waiting on
+  a child interpreter, so no idle Python process is left holding memory.
   """
-  subprocess.run([sys.executable, '-m', 'streamlit', 'run', 'app/streamlit_app.py'], check=True)
+  os.execvp(sys.executable, [sys.executable, '-m', 'streamlit', 'run', 'app/streamlit_app.py'])
 
 
 if __name__ == '__main__':
@@ -2,25 +2,43 @@
 Integration tests for the FastAPI application.
 """
 
+import os
 import unittest
+from unittest.mock import patch
 
 from fastapi.testclient import TestClient
 
 from api.infrastructure.api.main import create_app
 
 
-class TestHealthEndpoint(unittest.TestCase):
+_client: TestClient | None = None
+
+
+def setUpModule() -> None:
   """
-  Test cases for health check endpoint.
+  Start a single application and test client shared by all test classes.
+  """
+  global _client
+  _client = unittest.enterModuleContext(TestClient(create_app()))
+
+
+class APITestCase(unittest.TestCase):
+  """
+  Base class for tests against the shared application.
   """
 
   @classmethod
   def setUpClass(cls) -> None:
     """
-    Set up test client once for all tests.
+    Expose the shared test client to the test class.
     """
-    cls.app = create_app()
-    cls.client = TestClient(cls.app)
+    cls.client = _client
+
+
+class TestHealthEndpoint(APITestCase):
+  """
+  Test cases for health check endpoint.
+  """
 
   def test_health_check_returns_200(self) -> None:
     """
@@ -38,19 +56,11 @@ class TestHealthEndpoint(unittest.TestCase):
     self.assertEqual(data['status'], 'healthy')
 
 
-class TestPredictEndpoint(unittest.TestCase):
+class TestPredictEndpoint(APITestCase):
   """
   Test cases for prediction endpoint.
   """
 
-  @classmethod
-  def setUpClass(cls) -> None:
-    """
-    Set up test client once for all tests.
-    """
-    cls.app = create_app()
-    cls.client = TestClient(cls.app)
-
   def test_predict_returns_200_with_valid_input(self) -> None:
     """
     Test that predict returns 200 with valid input.
@@ -115,19 +125,123 @@ class TestPredictEndpoint(unittest.TestCase):
 
     self.assertEqual(response.status_code, 422)
 
+  def test_predict_returns_422_with_malformed_json(self) -> None:
+    """
+    Test that predict returns 422 when the body is not valid JSON.
+    """
+    response = self.client.post(
+      '/api/v1/predict', content=b'{"experience_months": 36,',
+      headers={'Content-Type': 'application/json'})
+
+    self.assertEqual(response.status_code, 422)
+    self.assertEqual(response.json()['detail'][0]['loc'], ['body'])
+
+  def test_predict_returns_422_with_non_utf8_body(self) -> None:
+    """
+    Test that predict returns 422 when the body is not valid UTF-8.
+    """
+    response = self.client.post(
+      '/api/v1/predict', content=b'\xff\xfe', headers={'Content-Type': 'application/json'})
+
+    self.assertEqual(response.status_code, 422)
+    self.assertEqual(response.json()['detail'][0]['loc'], ['body'])
 
-class TestModelInfoEndpoint(unittest.TestCase):
+  def test_predict_returns_422_with_non_json_content_type(self) -> None:
+    """
+    Test that predict rejects a JSON body sent with a non-JSON content type.
+    """
+    response = self.client.post(
+      '/api/v1/predict',
+      content=b'{"experience_months": 36, "number_of_sales": 50, "seasonal_factor": 7}',
+      headers={'Content-Type': 'text/plain'})
+
+    self.assertEqual(response.status_code, 422)
+    self.assertEqual(response.json()['detail'][0]['loc'], ['body'])
+
+  def test_predict_accepts_json_content_type_with_charset(self) -> None:
+    """
+    Test that predict accepts a JSON content type with parameters.
+    """
+    response = self.client.post(
+      '/api/v1/predict',
+      content=b'{"experience_months": 36, "number_of_sales": 50, "seasonal_factor": 7}',
+      headers={'Content-Type': 'application/json; charset=utf-8'})
+
+    self.assertEqual(response.status_code, 200)
+
+  def test_predict_documents_validation_error_response(self) -> None:
+    """
+    Test that the OpenAPI schema lists the 422 response of predict.
+    """
+    schema = self.client.get('/openapi.json').json()
+    response = schema['paths']['/api/v1/predict']['post']['responses']['422']
+    reference = response['content']['application/json']['schema']['$ref']
+
+    self.assertEqual(reference, '#/components/schemas/HTTPValidationError')
+    self.assertIn('HTTPValidationError', schema['components']['schemas'])
+
+
+class TestPredictBatchEndpoint(APITestCase):
   """
-  Test cases for model info endpoint.
+  Test cases for batch prediction endpoint.
   """
-  @classmethod
-  def setUpClass(cls) -> None:
+
+  def test_predict_batch_returns_one_prediction_per_item(self) -> None:
+    """
+    Test that predict batch returns a prediction for each input item.
+    """
+    payload = {'items': [
+      {'experience_months': 36, 'number_of_sales': 50, 'seasonal_factor': 7},
+      {'experience_months': 12, 'number_of_sales': 20, 'seasonal_factor': 3},
+    ]}
+
+    response = self.client.post('/api/v1/predict/batch', json=payload)
+    data = response.json()
+
+    self.assertEqual(response.status_code, 200)
+    self.assertEqual(len(data['predictions']), 2)
+
+  def test_predict_batch_matches_single_predictions(self) -> None:
+    """
+    Test that batch predictions match the single prediction endpoint.
+    """
+    item = {'experience_months': 36, 'number_of_sales': 50, 'seasonal_factor': 7}
+
+    batch = self.client.post('/api/v1/predict/batch', json={'items': [item]}).json()
+    single = self.client.post('/api/v1/predict', json=item).json()
+
+    self.assertAlmostEqual(batch['predictions'][0], single['predicted_revenue'], places=6)
+
+  def test_predict_batch_with_mixed_items_reports_failing_index(self) -> None:
+    """
+    Test that a negative prediction fails only its item and the rest of the batch is returned.
+    """
+    payload = {'items': [
+      {'experience_months': 36, 'number_of_sales': 50, 'seasonal_factor': 7},
+      {'experience_months': 600, 'number_of_sales': 1000, 'seasonal_factor': 10},
+    ]}
+
+    response = self.client.post('/api/v1/predict/batch', json=payload)
+    data = response.json()
+
+    self.assertEqual(response.status_code, 200)
+    self.assertIsInstance(data['predictions'][0], float)
+    self.assertIsNone(data['predictions'][1])
+    self.assertEqual([error['index'] for error in data['errors']], [1])
+
+  def test_predict_batch_returns_422_with_empty_items(self) -> None:
     """
-    Set up test client once for all tests.
+    Test that predict batch returns 422 when no items are sent.
     """
-    cls.app = create_app()
-    cls.client = TestClient(cls.app)
+    response = self.client.post('/api/v1/predict/batch', json={'items': []})
+
+    self.assertEqual(response.status_code, 422)
 
+
+class TestModelInfoEndpoint(APITestCase):
+  """
+  Test cases for model info endpoint.
+  """
   def test_model_info_returns_200(self) -> None:
     """
     Test that model info returns 200 OK.
@@ -147,5 +261,34 @@ class TestModelInfoEndpoint(unittest.TestCase):
     self.assertIn('features', data)
 
 
+class TestCorsConfiguration(unittest.TestCase):
+  """
+  Test cases for the optional CORS middleware.
+  """
+
+  def test_cors_disabled_by_default(self) -> None:
+    """
+    Test that no CORS headers are sent unless ENABLE_CORS is set.
+    """
+    with patch.dict(os.environ, {}, clear=False):
+      os.environ.pop('ENABLE_CORS', None)
+      client = TestClient(create_app())
+
+    response = client.get('/health', headers={'Origin': 'http://example.com'})
+
+    self.assertNotIn('access-control-allow-origin', response.headers)
+
+  def test_cors_enabled_with_env_var(self) -> None:
+    """
+    Test that CORS headers are sent when ENABLE_CORS is true.
+    """
+    with patch.dict(os.environ, {'ENABLE_CORS': 'true'}):
+      client = TestClient(create_app())
+
+    response = client.get('/health', headers={'Origin': 'http://example.com'})
+
+    self.assertIn('access-control-allow-origin', response.headers)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,50 @@
+"""
+Unit tests for application DTOs.
+"""
+
+import unittest
+
+from pydantic import ValidationError
+
+from api.application.dtos import PredictionInput
+
+
+class TestPredictionInput(unittest.TestCase):
+  """
+  Test cases for PredictionInput validation.
+  """
+
+  def test_valid_input_from_json(self) -> None:
+    """
+    Test that a valid JSON body is parsed into PredictionInput.
+    """
+    input_data = PredictionInput.model_validate_json(
+      b'{"experience_months": 36, "number_of_sales": 50, "seasonal_factor": 7}')
+
+    self.assertEqual(input_data.experience_months, 36)
+    self.assertEqual(input_data.number_of_sales, 50)
+    self.assertEqual(input_data.seasonal_factor, 7)
+
+  def test_seasonal_factor_bounds_are_inclusive(self) -> None:
+    """
+    Test that seasonal factor accepts both ends of the 1-10 range.
+    """
+    for seasonal_factor in (1, 10):
+      with self.subTest(seasonal_factor=seasonal_factor):
+        input_data = PredictionInput(
+          experience_months=0, number_of_sales=0, seasonal_factor=seasonal_factor)
+        self.assertEqual(input_data.seasonal_factor, seasonal_factor)
+
+  def test_out_of_range_values_report_each_field(self) -> None:
+    """
+    Test that every out-of-range field is reported in a single validation error.
+    """
+    with self.assertRaises(ValidationError) as context:
+      PredictionInput(experience_months=-1, number_of_sales=-1, seasonal_factor=0)
+
+    fields = {error['loc'][0] for error in context.exception.errors()}
+    self.assertEqual(fields, {'experience_months', 'number_of_sales', 'seasonal_factor'})
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,121 @@
+"""
+Unit tests for the ML model repository.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import PolynomialFeatures
+
+from api.infrastructure.ml.model_repository import ModelRepository
+
+
+class TestModelRepository(unittest.TestCase):
+  """
+  Test cases for ModelRepository.
+  """
+
+  @classmethod
+  def setUpClass(cls) -> None:
+    """
+    Load the saved model artifacts once for all tests.
+    """
+    cls.repository = ModelRepository()
+
+  def setUp(self) -> None:
+    """
+    Start every test with an empty prediction cache.
+    """
+    self.repository._cached_predict.cache_clear()
+
+  def test_predict_returns_float(self) -> None:
+    """
+    Test that predict returns a float.
+    """
+    result = self.repository.predict(
+      experience_months=36, number_of_sales=50, seasonal_factor=7)
+
+    self.assertIsInstance(result, float)
+
+  def test_predict_reuses_cached_result(self) -> None:
+    """
+    Test that repeated inputs are served from the cache.
+    """
+    first = self.repository.predict(experience_months=36, number_of_sales=50, seasonal_factor=7)
+    second = self.repository.predict(experience_months=36, number_of_sales=50, seasonal_factor=7)
+
+    cache_info = self.repository._cached_predict.cache_info()
+    self.assertEqual(first, second)
+    self.assertEqual(cache_info.misses, 1)
+    self.assertEqual(cache_info.hits, 1)
+
+  def test_transform_with_powers_matches_transformer(self) -> None:
+    """
+    Test that expanding features from the exponents matches the sklearn transformer.
+    """
+    X = np.array([[0, 0, 1], [12, 20, 3], [240, 800, 10]], dtype=np.float64)
+    expected = self.repository.transformer.transform(
+      pd.DataFrame(X, columns=ModelRepository.FEATURE_NAMES))
+
+    self.assertIsNotNone(self.repository.powers)
+    np.testing.assert_array_equal(self.repository._transform(X), expected)
+
+  def test_powers_are_not_used_for_reordered_features(self) -> None:
+    """
+    Test that a transformer fitted on differently ordered columns falls back to sklearn.
+    """
+    columns = list(reversed(ModelRepository.FEATURE_NAMES))
+    transformer = PolynomialFeatures(degree=2, include_bias=False).fit(
+      pd.DataFrame([[1, 2, 3], [4, 5, 6]], columns=columns))
+
+    with patch.object(self.repository, 'transformer', transformer):
+      self.assertIsNone(self.repository._load_powers())
+
+  def test_coefficients_are_compiled_for_polynomial_model(self) -> None:
+    """
+    Test that the saved polynomial model is reduced to closed-form coefficients.
+    """
+    self.assertIsNotNone(self.repository.coefficients)
+    self.assertEqual(len(self.repository.coefficients), len(ModelRepository.POLYNOMIAL_TERMS))
+
+  def test_stale_flat_model_is_not_used(self) -> None:
+    """
+    Test that flat weights disagreeing with the pickled model fall back to the pipeline.
+    """
+    stale_model = (np.zeros(len(self.repository.powers)), 0.0)
+
+    with patch.object(self.repository.model_loader, 'load_flat_model', return_value=stale_model):
+      self.assertIsNone(self.repository._compile_coefficients())
+
+  def test_closed_form_matches_pipeline(self) -> None:
+    """
+    Test that the closed-form polynomial matches the sklearn pipeline.
+    """
+    for inputs in [(0, 0, 1), (12, 20, 3), (36, 50, 7), (240, 800, 10)]:
+      with self.subTest(inputs=inputs):
+        self.assertAlmostEqual(
+          self.repository._predict(*inputs), self.repository._predict_pipeline(*inputs), places=6)
+
+  def test_predict_batch_matches_single_predictions(self) -> None:
+    """
+    Test that batch predictions match one-by-one predictions, in order.
+    """
+    inputs = [(0, 0, 1), (12, 20, 3), (36, 50, 7), (240, 800, 10)]
+
+    results = self.repository.predict_batch(inputs)
+
+    self.assertEqual(len(results), len(inputs))
+    for result, single_input in zip(results, inputs):
+      self.assertAlmostEqual(result, self.repository.predict(*single_input), places=6)
+
+  def test_predict_batch_with_empty_input(self) -> None:
+    """
+    Test that an empty batch returns an empty list.
+    """
+    self.assertEqual(self.repository.predict_batch([]), [])
+
+
+if __name__ == '__main__':
+  unittest.main()
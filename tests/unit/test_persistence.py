@@ -0,0 +1,257 @@
+"""
+Unit tests for persistence module.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import PolynomialFeatures
+
+from core.persistence import ModelLoader, _resolve_models_dir, get_default_loader
+
+
+class TestModelLoader(unittest.TestCase):
+  """
+  Test cases for ModelLoader class.
+  """
+  def setUp(self) -> None:
+    """
+    Set up a loader pointing to a temporary models directory.
+    """
+    self.temp_dir = tempfile.TemporaryDirectory()
+    self.models_dir = Path(self.temp_dir.name)
+    self.loader = ModelLoader(self.models_dir)
+
+  def tearDown(self) -> None:
+    """
+    Remove the temporary models directory.
+    """
+    self.temp_dir.cleanup()
+
+  def test_save_model_adds_joblib_extension(self) -> None:
+    """
+    Test that save_model appends the .joblib extension.
+    """
+    filepath = self.loader.save_model({'a': 1}, 'artifact')
+
+    self.assertEqual(filepath, self.models_dir / 'artifact.joblib')
+    self.assertTrue(filepath.exists())
+
+  def test_save_model_leaves_no_temporary_file(self) -> None:
+    """
+    Test that save_model renames its temporary file into place.
+    """
+    self.loader.save_model({'a': 1}, 'artifact')
+
+    self.assertEqual([path.name for path in self.models_dir.iterdir()], ['artifact.joblib'])
+
+  def test_save_metadata_and_flat_model_leave_no_temporary_files(self) -> None:
+    """
+    Test that save_metadata and save_flat_model rename their temporary files into place.
+    """
+    self.loader.save_metadata({'polynomial_degree': 2})
+    self.loader.save_flat_model(np.array([1.0]), 0.0)
+
+    self.assertEqual(
+      sorted(path.name for path in self.models_dir.iterdir()),
+      ['model_metadata.json', 'revenue_model_flat.npy'])
+
+  def test_failed_save_model_removes_temporary_file(self) -> None:
+    """
+    Test that save_model removes its temporary file when writing fails.
+    """
+    def failing_dump(model: object, filepath: Path, **kwargs: object) -> None:
+      filepath.write_bytes(b'partial')
+      raise OSError('disk full')
+
+    with patch('core.persistence.joblib.dump', side_effect=failing_dump):
+      with self.assertRaises(OSError):
+        self.loader.save_model({'a': 1}, 'artifact')
+
+    self.assertEqual(list(self.models_dir.iterdir()), [])
+
+  def test_failed_save_metadata_and_flat_model_remove_temporary_files(self) -> None:
+    """
+    Test that save_metadata and save_flat_model remove their temporary files when writing fails.
+    """
+    with self.assertRaises(TypeError):
+      self.loader.save_metadata({'model': object()})
+    with patch('core.persistence.np.save', side_effect=OSError('disk full')):
+      with self.assertRaises(OSError):
+        self.loader.save_flat_model(np.array([1.0]), 0.0)
+
+    self.assertEqual(list(self.models_dir.iterdir()), [])
+
+  def test_save_and_load_model_round_trip(self) -> None:
+    """
+    Test that a saved model can be loaded back with the same predictions.
+    """
+    X = np.array([[1.0], [2.0], [3.0]])
+    model = LinearRegression().fit(X, [2.0, 4.0, 6.0])
+
+    self.loader.save_model(model, 'revenue_model')
+    loaded = self.loader.load_model('revenue_model')
+
+    np.testing.assert_allclose(loaded.predict(X), model.predict(X))
+
+  def test_loaded_arrays_are_read_only_memory_maps(self) -> None:
+    """
+    Test that arrays in a loaded model are read-only memory maps of the file.
+    """
+    X = np.array([[1.0], [2.0], [3.0]])
+    self.loader.save_model(LinearRegression().fit(X, [2.0, 4.0, 6.0]), 'revenue_model')
+
+    loaded = self.loader.load_model('revenue_model')
+
+    self.assertIsInstance(loaded.coef_, np.memmap)
+    self.assertFalse(loaded.coef_.flags.writeable)
+
+  def test_memory_mapped_transformer_still_transforms(self) -> None:
+    """
+    Test that a transformer loaded with read-only arrays transforms like the original.
+    """
+    X = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    transformer = PolynomialFeatures(degree=2, include_bias=False).fit(X)
+    self.loader.save_model(transformer, 'polynomial_transformer')
+
+    loaded = self.loader.load_transformer()
+
+    np.testing.assert_array_equal(loaded.transform(X), transformer.transform(X))
+
+  def test_load_model_returns_cached_object(self) -> None:
+    """
+    Test that loading the same model twice returns the cached object.
+    """
+    self.loader.save_model({'a': 1}, 'artifact')
+
+    first = self.loader.load_model('artifact')
+    second = self.loader.load_model('artifact.joblib')
+
+    self.assertIs(first, second)
+
+  def test_save_model_invalidates_cache(self) -> None:
+    """
+    Test that saving a model replaces the previously cached version.
+    """
+    self.loader.save_model({'version': 1}, 'artifact')
+    self.loader.load_model('artifact')
+
+    self.loader.save_model({'version': 2}, 'artifact')
+
+    self.assertEqual(self.loader.load_model('artifact'), {'version': 2})
+
+  def test_save_and_load_metadata_as_json(self) -> None:
+    """
+    Test that metadata is saved as JSON and loaded back unchanged.
+    """
+    metadata = {'polynomial_degree': 2, 'features': ['a', 'b'], 'r2_test_score': 0.5}
+
+    filepath = self.loader.save_metadata(metadata)
+
+    self.assertEqual(filepath, self.models_dir / 'model_metadata.json')
+    self.assertEqual(ModelLoader(self.models_dir).load_metadata(), metadata)
+
+  def test_load_metadata_falls_back_to_joblib(self) -> None:
+    """
+    Test that legacy joblib metadata is loaded when no JSON file exists.
+    """
+    self.loader.save_model({'polynomial_degree': 2}, 'model_metadata')
+
+    self.assertEqual(self.loader.load_metadata(), {'polynomial_degree': 2})
+
+  def test_save_and_load_flat_model(self) -> None:
+    """
+    Test that flat linear weights are loaded back as (coefficients, intercept).
+    """
+    self.loader.save_flat_model(np.array([1.5, -2.0, 3.25]), np.float64(10.0))
+
+    coef, intercept = ModelLoader(self.models_dir).load_flat_model()
+
+    np.testing.assert_array_equal(coef, [1.5, -2.0, 3.25])
+    self.assertEqual(intercept, 10.0)
+
+  def test_flat_model_is_stored_in_double_precision(self) -> None:
+    """
+    Test that single-precision weights are widened to float64 when saved.
+    """
+    self.loader.save_flat_model(np.array([1.5, -2.0], dtype=np.float32), np.float32(10.0))
+
+    coef, _ = self.loader.load_flat_model()
+
+    self.assertEqual(coef.dtype, np.float64)
+
+  def test_load_missing_flat_model_raises_error(self) -> None:
+    """
+    Test that loading a missing flat model raises FileNotFoundError.
+    """
+    with self.assertRaises(FileNotFoundError):
+      self.loader.load_flat_model()
+
+  def test_prefetch_advises_each_artifact(self) -> None:
+    """
+    Test that prefetch asks the OS to read ahead every saved artifact.
+    """
+    self.loader.save_model({'a': 1}, 'artifact')
+    self.loader.save_metadata({'polynomial_degree': 2})
+    (self.models_dir / '.gitkeep').touch()
+
+    with patch('core.persistence.os.posix_fadvise', create=True) as fadvise:
+      self.loader.prefetch()
+
+    self.assertEqual(fadvise.call_count, 2)
+
+  def test_load_missing_model_raises_error(self) -> None:
+    """
+    Test that loading a missing model raises FileNotFoundError.
+    """
+    with self.assertRaises(FileNotFoundError) as context:
+      self.loader.load_model('missing_model')
+
+    self.assertIn('Model not found', str(context.exception))
+
+
+class TestResolveModelsDir(unittest.TestCase):
+  """
+  Test cases for the default models directory lookup.
+  """
+
+  def test_default_models_dir_is_resolved_once(self) -> None:
+    """
+    Test that loaders without an explicit directory reuse the cached lookup.
+    """
+    _resolve_models_dir.cache_clear()
+
+    first = ModelLoader()
+    second = ModelLoader()
+
+    self.assertEqual(first.models_dir, second.models_dir)
+    self.assertEqual(_resolve_models_dir.cache_info().misses, 1)
+
+
+class TestGetDefaultLoader(unittest.TestCase):
+  """
+  Test cases for the shared default loader.
+  """
+
+  def test_returns_same_loader(self) -> None:
+    """
+    Test that every call returns the same loader instance.
+    """
+    self.assertIs(get_default_loader(), get_default_loader())
+
+  def test_artifacts_are_loaded_eagerly(self) -> None:
+    """
+    Test that the loader's artifacts are already cached when it is returned.
+    """
+    loader = get_default_loader()
+
+    self.assertIn('polynomial_transformer.joblib', loader._cache)
+    self.assertIn('revenue_model.joblib', loader._cache)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -58,6 +58,17 @@ class TestDataPreprocessor(unittest.TestCase):
     self.assertEqual(len(feature_names), 9)
     self.assertIsInstance(feature_names, list)
 
+  def test_get_feature_names_out_is_refreshed_on_refit(self) -> None:
+    """
+    Test that refitting on different data recomputes the cached feature names.
+    """
+    self.preprocessor.fit(self.sample_data)
+    self.preprocessor.fit(self.sample_data[:, :2])
+
+    feature_names = self.preprocessor.get_feature_names_out()
+
+    self.assertEqual(feature_names, ['x0', 'x1', 'x0^2', 'x0 x1', 'x1^2'])
+
   def test_get_feature_names_without_fit_raises_error(self) -> None:
     """
     Test that get_feature_names_out without fit raises ValueError.
@@ -77,6 +88,43 @@ class TestDataPreprocessor(unittest.TestCase):
     self.assertEqual(result.shape, (1, 3))
     np.testing.assert_array_equal(result, [[36, 50, 7]])
 
+  def test_validate_input_returns_fortran_float_array(self) -> None:
+    """
+    Test that validate_input returns column-major float64 data.
+    """
+    data = {'years_of_experience': 36, 'number_of_sales': 50, 'seasonal_factor': 7}
+    result = self.preprocessor.validate_input(data)
+
+    self.assertEqual(result.dtype, np.float64)
+    self.assertTrue(result.flags.f_contiguous)
+
+  def test_validate_input_accepts_batch(self) -> None:
+    """
+    Test validate_input with a list of dictionaries.
+    """
+    data = [
+      {'years_of_experience': 36, 'number_of_sales': 50, 'seasonal_factor': 7},
+      {'years_of_experience': 24, 'number_of_sales': 30, 'seasonal_factor': 5},
+    ]
+    result = self.preprocessor.validate_input(data)
+
+    np.testing.assert_array_equal(result, [[36, 50, 7], [24, 30, 5]])
+    self.assertTrue(result.flags.f_contiguous)
+
+  def test_validate_input_batch_missing_feature_raises_error(self) -> None:
+    """
+    Test that a batch with a row missing a feature raises ValueError.
+    """
+    data = [
+      {'years_of_experience': 36, 'number_of_sales': 50, 'seasonal_factor': 7},
+      {'years_of_experience': 24, 'number_of_sales': 30},
+    ]
+
+    with self.assertRaises(ValueError) as context:
+      self.preprocessor.validate_input(data)
+
+    self.assertIn('Missing required features', str(context.exception))
+
   def test_validate_input_missing_feature_raises_error(self) -> None:
     """
     Test validate_input with missing feature raises ValueError.
@@ -88,6 +136,61 @@ class TestDataPreprocessor(unittest.TestCase):
 
     self.assertIn('Missing required features', str(context.exception))
 
+  def test_validate_and_transform_matches_sklearn(self) -> None:
+    """
+    Test that the degree-2 fast path matches PolynomialFeatures column by column.
+    """
+    data = {'years_of_experience': 36, 'number_of_sales': 50, 'seasonal_factor': 7}
+    expected = self.preprocessor.fit_transform(np.array([[36, 50, 7]]))
+
+    result = self.preprocessor.validate_and_transform(data)
+
+    self.assertEqual(result.shape, (1, 9))
+    np.testing.assert_array_equal(result, expected)
+
+  def test_validate_and_transform_falls_back_for_other_degrees(self) -> None:
+    """
+    Test that other degrees use the fitted transformer.
+    """
+    preprocessor = DataPreprocessor(degree=3).fit(self.sample_data)
+    data = {'years_of_experience': 36, 'number_of_sales': 50, 'seasonal_factor': 7}
+
+    result = preprocessor.validate_and_transform(data)
+
+    np.testing.assert_array_equal(result, preprocessor.transform(np.array([[36, 50, 7]])))
+
+  def test_validate_and_transform_without_fit_raises_error(self) -> None:
+    """
+    Test that validate_and_transform on an unfitted preprocessor raises ValueError.
+    """
+    data = {'years_of_experience': 36, 'number_of_sales': 50, 'seasonal_factor': 7}
+
+    with self.assertRaises(ValueError) as context:
+      self.preprocessor.validate_and_transform(data)
+
+    self.assertIn('Transformer not fitted', str(context.exception))
+
+  def test_validate_and_transform_rejects_transformer_fitted_on_other_features(self) -> None:
+    """
+    Test that a transformer fitted on a different number of features is not bypassed.
+    """
+    self.preprocessor.fit(self.sample_data[:, :2])
+    data = {'years_of_experience': 36, 'number_of_sales': 50, 'seasonal_factor': 7}
+
+    with self.assertRaises(ValueError):
+      self.preprocessor.validate_and_transform(data)
+
+  def test_validate_and_transform_missing_feature_raises_error(self) -> None:
+    """
+    Test validate_and_transform with missing feature raises ValueError.
+    """
+    data = {'years_of_experience': 36, 'number_of_sales': 50}
+
+    with self.assertRaises(ValueError) as context:
+      self.preprocessor.validate_and_transform(data)
+
+    self.assertIn('Missing required features', str(context.exception))
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -5,8 +5,9 @@ Unit tests for application use cases.
 import unittest
 from unittest.mock import Mock
 
-from api.application.dtos import PredictionInput, PredictionOutput
-from api.application.use_cases import PredictRevenueUseCase
+from api.application.dtos import (
+  BatchPredictionInput, BatchPredictionOutput, PredictionInput, PredictionOutput)
+from api.application.use_cases import PredictRevenueBatchUseCase, PredictRevenueUseCase
 
 
 class TestPredictRevenueUseCase(unittest.TestCase):
@@ -63,6 +64,74 @@ class TestPredictRevenueUseCase(unittest.TestCase):
     self.assertEqual(result.number_of_sales, 20)
     self.assertEqual(result.seasonal_factor, 3)
 
+  def test_execute_with_negative_prediction_raises_error(self) -> None:
+    """
+    Test that a negative predicted revenue raises ValueError.
+    """
+    self.mock_repository.predict.return_value = -100.0
+
+    input_data = PredictionInput(experience_months=36, number_of_sales=50, seasonal_factor=7)
+
+    with self.assertRaises(ValueError) as context:
+      self.use_case.execute(input_data)
+
+    self.assertIn('Predicted revenue cannot be negative', str(context.exception))
+
+
+class TestPredictRevenueBatchUseCase(unittest.TestCase):
+  """
+  Test cases for PredictRevenueBatchUseCase.
+  """
+  def setUp(self) -> None:
+    """
+    Set up test fixtures.
+    """
+    self.mock_repository = Mock()
+    self.mock_repository.predict_batch.return_value = [5644.24, 3000.00]
+
+    self.use_case = PredictRevenueBatchUseCase(self.mock_repository)
+    self.input_data = BatchPredictionInput(items=[
+      PredictionInput(experience_months=36, number_of_sales=50, seasonal_factor=7),
+      PredictionInput(experience_months=12, number_of_sales=20, seasonal_factor=3)])
+
+  def test_execute_returns_predictions_in_order(self) -> None:
+    """
+    Test that execute returns one prediction per item, in input order.
+    """
+    result = self.use_case.execute(self.input_data)
+
+    self.assertIsInstance(result, BatchPredictionOutput)
+    self.assertEqual(result.predictions, [5644.24, 3000.00])
+
+  def test_execute_calls_repository_predict_batch_once(self) -> None:
+    """
+    Test that all items are sent to the repository in a single call.
+    """
+    self.use_case.execute(self.input_data)
+
+    self.mock_repository.predict_batch.assert_called_once_with([(36, 50, 7), (12, 20, 3)])
+
+  def test_execute_with_negative_prediction_reports_item_error(self) -> None:
+    """
+    Test that a negative predicted revenue fails only its own item, reported by index.
+    """
+    self.mock_repository.predict_batch.return_value = [5644.24, -100.0]
+
+    result = self.use_case.execute(self.input_data)
+
+    self.assertEqual(result.predictions, [5644.24, None])
+    self.assertEqual(len(result.errors), 1)
+    self.assertEqual(result.errors[0].index, 1)
+    self.assertIn('cannot be negative', result.errors[0].detail)
+
+  def test_execute_without_invalid_predictions_has_no_errors(self) -> None:
+    """
+    Test that a batch of valid predictions reports no errors.
+    """
+    result = self.use_case.execute(self.input_data)
+
+    self.assertEqual(result.errors, [])
+
 
 if __name__ == '__main__':
   unittest.main()